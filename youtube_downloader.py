@@ -5,18 +5,21 @@ An interactive CLI utility to download YouTube videos using yt-dlp.
 Includes video stitching and YouTube upload capabilities.
 """
 
-import yt_dlp
+import atexit
+import functools
 import sys
 import os
-import readline  # Enables arrow keys and history in input
+import json
+import mimetypes
 from datetime import datetime
-import pickle
-import http.client
-import httplib2
+import mmap
 import random
+import re
 import subprocess
 import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 # ANSI Color Codes
@@ -39,15 +42,49 @@ class Colors:
     BG_GREEN = '\033[42m'
     BG_BLUE = '\033[44m'
 
+    @classmethod
+    def disable(cls):
+        """Blank every colour code so output carries no ANSI escapes."""
+        for name in [n for n in vars(cls) if n.isupper()]:
+            setattr(cls, name, '')
+
+
+# Plain output when piped or when NO_COLOR is set (https://no-color.org)
+if os.environ.get('NO_COLOR') or not sys.stdout.isatty():
+    Colors.disable()
+
+
+# Row templates for file menus, with the colour codes baked in once
+_ROW_COLORS = dict(g=Colors.GREEN, r=Colors.RESET, w=Colors.WHITE, d=Colors.DIM)
+LIST_VIDEO_ROW = "  {g}[{{idx:2d}}]{r} 🎬 {w}{{name}}{r} {d}({{size_mb:.1f}} MB){r}".format(**_ROW_COLORS)
+LIST_OTHER_ROW = "       🎵 {w}{{name}}{r} {d}({{size_mb:.1f}} MB){r}".format(**_ROW_COLORS)
+MENU_VIDEO_ROW = "  {g}[{{idx:2d}}]{r} {w}{{name}}{r} {d}({{size_mb:.1f}} MB){r}".format(**_ROW_COLORS)
+
 
 OUTPUT_PATH = "/app/downloads"
 WORK_PATH = OUTPUT_PATH  # Current working folder (can be a subdirectory)
 CREDENTIALS_PATH = "/app/credentials"
 CLIENT_SECRETS_FILE = "/app/client_secrets.json"
-OAUTH_TOKEN_FILE = os.path.join(CREDENTIALS_PATH, "youtube_oauth.pickle")
-GCS_TOKEN_FILE = os.path.join(CREDENTIALS_PATH, "gcs_oauth.pickle")
+OAUTH_TOKEN_FILE = os.path.join(CREDENTIALS_PATH, "youtube_oauth.json")
+GCS_TOKEN_FILE = os.path.join(CREDENTIALS_PATH, "gcs_oauth.json")
+# Pickled tokens written by older versions; migrated to JSON on first load
+LEGACY_OAUTH_TOKEN_FILE = os.path.join(CREDENTIALS_PATH, "youtube_oauth.pickle")
+LEGACY_GCS_TOKEN_FILE = os.path.join(CREDENTIALS_PATH, "gcs_oauth.pickle")
 GCS_BUCKET_FILE = os.path.join(CREDENTIALS_PATH, "gcs_bucket.txt")
+GCS_CHUNK_SIZE_FILE = os.path.join(CREDENTIALS_PATH, "gcs_chunk_sizes.json")
 VIDEO_EXTENSIONS = ('.mp4', '.mkv', '.webm', '.avi', '.mov')
+UNSAFE_FILENAME_CHARS_RE = re.compile(r'[^\w\s-]')
+FILENAME_SEPARATORS_RE = re.compile(r'[-\s]+')
+OAUTH_CODE_RE = re.compile(r'[?&]code=([^&#]+)')
+CONTENT_TYPES = {
+    '.mp4': 'video/mp4',
+    '.mkv': 'video/x-matroska',
+    '.webm': 'video/webm',
+    '.avi': 'video/x-msvideo',
+    '.mov': 'video/quicktime',
+    '.mp3': 'audio/mpeg',
+    '.png': 'image/png',
+}
 HOST_ROOT_MAPPINGS = []
 EXTERNAL_PROJECT_PATH = ""
 EXTERNAL_PROJECT_LABEL = ""
@@ -61,6 +98,78 @@ GCS_SCOPE = "https://www.googleapis.com/auth/devstorage.read_write"
 MAX_RETRIES = 10
 RETRIABLE_STATUS_CODES = [500, 502, 503, 504]
 
+# Resumable uploads (YouTube and GCS) require non-final chunks in multiples of 256 KiB
+RESUMABLE_CHUNK_ALIGNMENT = 256 * 1024
+
+# YouTube upload chunk sizing; YTD_UPLOAD_CHUNK_MB overrides the size-based pick
+YOUTUBE_MIN_CHUNK_SIZE = 5 * 1024 * 1024
+YOUTUBE_MAX_CHUNK_SIZE = 100 * 1024 * 1024
+YOUTUBE_CHUNKS_PER_FILE = 50
+
+BACKUP_MAX_WORKERS = 4
+PROGRESS_INTERVAL = 0.2  # Minimum seconds between download/upload progress redraws
+DIR_CACHE_TTL = 2.0  # Seconds a folder listing is reused while the folder's mtime is unchanged
+YES_ANSWERS = frozenset({'', 'y', 'yes'})  # Replies accepted at a [Y/n] prompt
+
+# GCS resumable upload chunk sizing
+GCS_MIN_CHUNK_SIZE = 1024 * 1024
+GCS_MAX_CHUNK_SIZE = 64 * 1024 * 1024
+GCS_DEFAULT_CHUNK_SIZE = 10 * 1024 * 1024
+GCS_THROUGHPUT_SMOOTHING = 0.3
+
+# Shared HTTP session for Google REST calls (created on first use)
+_HTTP_SESSION = None
+# Persistent httplib2 connection pool behind the YouTube API client
+_YOUTUBE_HTTP = None
+# When progress_hook last redrew the download progress line
+_LAST_PROGRESS_TIME = 0.0
+# yt-dlp instances keyed by their frozen options, reused across commands
+_YDL_CACHE = {}
+# Folder listings keyed by path: (mtime_ns, scanned_at, files, subdirs)
+_DIR_CACHE = {}
+# Line editor shared by every prompt (created on first use)
+_PROMPT_SESSION = None
+# Authenticated clients reused for the rest of the CLI session
+_YOUTUBE_SERVICE = None
+_YOUTUBE_CREDENTIALS = None
+_GCS_CREDENTIALS = None
+# Serializes token refreshes when several uploads share one credentials object
+_CREDENTIALS_LOCK = threading.Lock()
+# Serializes updates to GCS_CHUNK_SIZE_FILE from concurrent backups
+_CHUNK_SIZE_LOCK = threading.Lock()
+# Background work after an upload (QR codes); threads start on first submit
+_POST_POOL = ThreadPoolExecutor(max_workers=2)
+
+
+def get_prompt_session():
+    """Return the shared prompt_toolkit session, or None when input() should be used."""
+    global _PROMPT_SESSION
+    if _PROMPT_SESSION is None:
+        session = False
+        if sys.stdin.isatty() and sys.stdout.isatty():
+            try:
+                from prompt_toolkit import PromptSession
+                session = PromptSession()
+            except ImportError:
+                pass
+        if not session:
+            import readline  # Enables arrow keys and history in input()
+        _PROMPT_SESSION = session
+    return _PROMPT_SESSION or None
+
+
+def prompt_input(message: str = "") -> str:
+    """Read a line from the user, keeping one line editor and history for the whole session."""
+    session = get_prompt_session()
+    if session is None:
+        return input(message)
+
+    from prompt_toolkit.formatted_text import ANSI
+    from prompt_toolkit.patch_stdout import patch_stdout
+    # Background prints (e.g. report_qr_code) are drawn above the prompt instead of through it
+    with patch_stdout(raw=True):
+        return session.prompt(ANSI(message))
+
 
 def normalize_optional_path(path: str) -> str:
     """Normalize a path string while preserving empty values."""
@@ -231,6 +340,13 @@ def set_project(name: str = None):
     return True
 
 
+def count_video_files(path: str) -> int:
+    """Count video files directly inside path."""
+    with os.scandir(path) as entries:
+        return sum(1 for entry in entries
+                   if entry.is_file() and entry.name.lower().endswith(VIDEO_EXTENSIONS))
+
+
 def list_projects():
     """List subdirectories in the downloads folder."""
     c = Colors
@@ -238,31 +354,32 @@ def list_projects():
         print(f"{c.YELLOW}📭 No downloads folder yet.{c.RESET}")
         return
 
-    dirs = sorted(d for d in os.listdir(OUTPUT_PATH)
-                  if os.path.isdir(os.path.join(OUTPUT_PATH, d)))
+    # One scandir pass over the root gives both the project folders and its video count
+    dirs = []
+    root_videos = 0
+    with os.scandir(OUTPUT_PATH) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                dirs.append(entry.name)
+            elif entry.is_file() and entry.name.lower().endswith(VIDEO_EXTENSIONS):
+                root_videos += 1
+    dirs.sort()
 
     print(f"\n{c.CYAN}{c.BOLD}📂 Projects{c.RESET} {c.DIM}(subfolders in {OUTPUT_PATH}){c.RESET}")
     print(f"{c.DIM}{'─' * 60}{c.RESET}")
 
     # Show root folder
-    root_videos = len([f for f in os.listdir(OUTPUT_PATH)
-                       if os.path.isfile(os.path.join(OUTPUT_PATH, f))
-                       and f.lower().endswith(VIDEO_EXTENSIONS)])
     marker = f" {c.YELLOW}◀ active{c.RESET}" if WORK_PATH == OUTPUT_PATH else ""
     print(f"  {c.GREEN}[root]{c.RESET}  {c.WHITE}/ (downloads root){c.RESET} {c.DIM}({root_videos} videos){c.RESET}{marker}")
 
     for d in dirs:
         full = os.path.join(OUTPUT_PATH, d)
-        vid_count = len([f for f in os.listdir(full)
-                         if os.path.isfile(os.path.join(full, f))
-                         and f.lower().endswith(VIDEO_EXTENSIONS)])
+        vid_count = count_video_files(full)
         marker = f" {c.YELLOW}◀ active{c.RESET}" if WORK_PATH == full else ""
         print(f"  {c.GREEN}[ {d} ]{c.RESET}  {c.DIM}({vid_count} videos){c.RESET}{marker}")
 
     if EXTERNAL_PROJECT_PATH and os.path.isdir(EXTERNAL_PROJECT_PATH):
-        vid_count = len([f for f in os.listdir(EXTERNAL_PROJECT_PATH)
-                         if os.path.isfile(os.path.join(EXTERNAL_PROJECT_PATH, f))
-                         and f.lower().endswith(VIDEO_EXTENSIONS)])
+        vid_count = count_video_files(EXTERNAL_PROJECT_PATH)
         marker = f" {c.YELLOW}◀ active{c.RESET}" if is_within_directory(WORK_PATH, EXTERNAL_PROJECT_PATH) else ""
         label = EXTERNAL_PROJECT_LABEL or os.path.basename(EXTERNAL_PROJECT_PATH)
         print(f"  {c.BLUE}[external]{c.RESET} {c.WHITE}{label}{c.RESET} {c.DIM}({vid_count} videos){c.RESET}{marker}")
@@ -276,6 +393,36 @@ def list_projects():
         print(f"\n{c.DIM}Switch with:{c.RESET} {c.CYAN}project <name>{c.RESET}  |  {c.CYAN}project root{c.RESET} to go back")
 
 
+def freeze_options(value):
+    """Return a hashable snapshot of a yt-dlp options value."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze_options(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_options(item) for item in value)
+    return value
+
+
+def get_ydl(ydl_opts: dict):
+    """Return a yt_dlp.YoutubeDL for these options, reusing one built earlier in the session."""
+    key = freeze_options(ydl_opts)
+    ydl = _YDL_CACHE.get(key)
+    if ydl is None:
+        import yt_dlp
+        # YoutubeDL keeps the dict it is given, so hand it a private copy
+        ydl = _YDL_CACHE[key] = yt_dlp.YoutubeDL(dict(ydl_opts))
+    return ydl
+
+
+def close_cached_ydls():
+    """Close every cached yt-dlp instance (saves cookies, releases handles)."""
+    for ydl in _YDL_CACHE.values():
+        ydl.close()
+    _YDL_CACHE.clear()
+
+
+atexit.register(close_cached_ydls)
+
+
 def download_video(url: str, quality: str = "best"):
     """Download a YouTube video."""
     c = Colors
@@ -289,21 +436,28 @@ def download_video(url: str, quality: str = "best"):
     }
     
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            print(f"\n{c.CYAN}🔍 Fetching video info for:{c.RESET} {url}")
-            info = ydl.extract_info(url, download=True)
-            print(f"\n{c.GREEN}✅ Downloaded:{c.RESET} {c.WHITE}{info.get('title', 'Unknown')}{c.RESET}")
-            print(f"{c.CYAN}📁 Saved to:{c.RESET} {WORK_PATH}")
-            return True
+        ydl = get_ydl(ydl_opts)
+        print(f"\n{c.CYAN}🔍 Fetching video info for:{c.RESET} {url}")
+        info = ydl.extract_info(url, download=True)
+        print(f"\n{c.GREEN}✅ Downloaded:{c.RESET} {c.WHITE}{info.get('title', 'Unknown')}{c.RESET}")
+        print(f"{c.CYAN}📁 Saved to:{c.RESET} {WORK_PATH}")
+        return True
     except Exception as e:
         print(f"\n{c.RED}❌ Error downloading video:{c.RESET} {e}")
         return False
+    finally:
+        invalidate_dir_cache()
 
 
 def progress_hook(d):
     """Display download progress."""
+    global _LAST_PROGRESS_TIME
     c = Colors
     if d['status'] == 'downloading':
+        now = time.monotonic()
+        if now - _LAST_PROGRESS_TIME < PROGRESS_INTERVAL:
+            return
+        _LAST_PROGRESS_TIME = now
         percent = d.get('_percent_str', 'N/A')
         speed = d.get('_speed_str', 'N/A')
         print(f"\r{c.CYAN}⬇️  Downloading:{c.RESET} {c.GREEN}{percent}{c.RESET} at {c.YELLOW}{speed}{c.RESET}   ", end='', flush=True)
@@ -328,49 +482,99 @@ def download_audio_only(url: str):
     }
     
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            print(f"\n{c.CYAN}🔍 Fetching audio for:{c.RESET} {url}")
-            info = ydl.extract_info(url, download=True)
-            print(f"\n{c.GREEN}✅ Downloaded audio:{c.RESET} {c.WHITE}{info.get('title', 'Unknown')}{c.RESET}")
-            print(f"{c.CYAN}📁 Saved to:{c.RESET} {WORK_PATH}")
-            return True
+        ydl = get_ydl(ydl_opts)
+        print(f"\n{c.CYAN}🔍 Fetching audio for:{c.RESET} {url}")
+        info = ydl.extract_info(url, download=True)
+        print(f"\n{c.GREEN}✅ Downloaded audio:{c.RESET} {c.WHITE}{info.get('title', 'Unknown')}{c.RESET}")
+        print(f"{c.CYAN}📁 Saved to:{c.RESET} {WORK_PATH}")
+        return True
     except Exception as e:
         print(f"\n{c.RED}❌ Error downloading audio:{c.RESET} {e}")
         return False
+    finally:
+        invalidate_dir_cache()
 
 
 def get_video_info(url: str):
     """Get information about a video without downloading."""
     c = Colors
-    ydl_opts = {'quiet': True}
+    # Metadata only: no format probing, playlist expansion or download
+    ydl_opts = {
+        'quiet': True,
+        'no_warnings': True,
+        'skip_download': True,
+        'extract_flat': True,
+        'noplaylist': True,
+        'socket_timeout': 10,
+    }
     
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        ydl = get_ydl(ydl_opts)
+        info = ydl.extract_info(url, download=False)
+        if info.get('channel') is None or info.get('view_count') is None:
+            # Flat extraction can omit fields for some URLs; retry once with a full pass
+            ydl = get_ydl({**ydl_opts, 'extract_flat': False})
             info = ydl.extract_info(url, download=False)
-            print(f"\n{c.CYAN}╔{'═'*48}╗{c.RESET}")
-            print(f"{c.CYAN}║{c.RESET}  {c.BOLD}ℹ️  Video Information{c.RESET}")
-            print(f"{c.CYAN}╠{'═'*48}╣{c.RESET}")
-            print(f"{c.CYAN}║{c.RESET}  {c.WHITE}Title:{c.RESET}    {info.get('title')}")
-            print(f"{c.CYAN}║{c.RESET}  {c.WHITE}Duration:{c.RESET} {info.get('duration', 0) // 60}:{info.get('duration', 0) % 60:02d}")
-            print(f"{c.CYAN}║{c.RESET}  {c.WHITE}Channel:{c.RESET}  {info.get('channel')}")
-            print(f"{c.CYAN}║{c.RESET}  {c.WHITE}Views:{c.RESET}    {info.get('view_count', 'N/A'):,}")
-            print(f"{c.CYAN}╚{'═'*48}╝{c.RESET}")
-            return info
+        print(f"\n{c.CYAN}╔{'═'*48}╗{c.RESET}")
+        print(f"{c.CYAN}║{c.RESET}  {c.BOLD}ℹ️  Video Information{c.RESET}")
+        print(f"{c.CYAN}╠{'═'*48}╣{c.RESET}")
+        print(f"{c.CYAN}║{c.RESET}  {c.WHITE}Title:{c.RESET}    {info.get('title')}")
+        print(f"{c.CYAN}║{c.RESET}  {c.WHITE}Duration:{c.RESET} {info.get('duration', 0) // 60}:{info.get('duration', 0) % 60:02d}")
+        print(f"{c.CYAN}║{c.RESET}  {c.WHITE}Channel:{c.RESET}  {info.get('channel')}")
+        print(f"{c.CYAN}║{c.RESET}  {c.WHITE}Views:{c.RESET}    {info.get('view_count', 'N/A'):,}")
+        print(f"{c.CYAN}╚{'═'*48}╝{c.RESET}")
+        return info
     except Exception as e:
         print(f"{c.RED}❌ Error fetching info:{c.RESET} {e}")
         return None
 
 
-def get_video_files():
-    """Get list of video files in current working folder."""
-    if not os.path.exists(WORK_PATH):
-        return []
+def print_lines(lines):
+    """Write a block of lines to stdout with a single write and flush."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def scan_work_dir():
+    """Return ((name, size) files, subdir names) for the working folder, both sorted.
+
+    Back-to-back commands reuse the previous scan for DIR_CACHE_TTL
+    seconds as long as the folder's mtime hasn't changed.
+    """
+    try:
+        mtime_ns = os.stat(WORK_PATH).st_mtime_ns
+    except FileNotFoundError:
+        return [], []
     
+    now = time.monotonic()
+    cached = _DIR_CACHE.get(WORK_PATH)
+    if cached and cached[0] == mtime_ns and now - cached[1] < DIR_CACHE_TTL:
+        return cached[2], cached[3]
+    
+    # Single directory pass; DirEntry caches the type and stat results
     files = []
-    for f in sorted(os.listdir(WORK_PATH)):
-        if os.path.isfile(os.path.join(WORK_PATH, f)) and f.lower().endswith(VIDEO_EXTENSIONS):
-            files.append(f)
-    return files
+    subdirs = []
+    with os.scandir(WORK_PATH) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                subdirs.append(entry.name)
+            elif entry.is_file():
+                files.append((entry.name, entry.stat().st_size))
+    files.sort()
+    subdirs.sort()
+    _DIR_CACHE[WORK_PATH] = (mtime_ns, now, files, subdirs)
+    return files, subdirs
+
+
+def invalidate_dir_cache():
+    """Forget cached folder listings after this process writes files."""
+    _DIR_CACHE.clear()
+
+
+def get_video_entries():
+    """Get (name, size in bytes) for video files in current working folder, sorted by name."""
+    files, _ = scan_work_dir()
+    return [(name, size) for name, size in files if name.lower().endswith(VIDEO_EXTENSIONS)]
 
 
 def list_downloads():
@@ -380,26 +584,23 @@ def list_downloads():
         print(f"{c.YELLOW}📭 No downloads yet.{c.RESET}")
         return
     
-    files = [f for f in os.listdir(WORK_PATH) if os.path.isfile(os.path.join(WORK_PATH, f))]
-    subdirs = [d for d in os.listdir(WORK_PATH) if os.path.isdir(os.path.join(WORK_PATH, d))]
+    files, subdirs = scan_work_dir()
     if not files and not subdirs:
         print(f"{c.YELLOW}📭 No files yet.{c.RESET}")
         return
     
-    print(f"\n{c.CYAN}{c.BOLD}📁 Files{c.RESET} {c.DIM}({WORK_PATH}){c.RESET}")
-    print(f"{c.DIM}{'─' * 60}{c.RESET}")
+    divider = f"{c.DIM}{'─' * 60}{c.RESET}"
+    lines = [f"\n{c.CYAN}{c.BOLD}📁 Files{c.RESET} {c.DIM}({WORK_PATH}){c.RESET}", divider]
     # Show subdirectories first
-    for d in sorted(subdirs):
-        print(f"       📂 {c.CYAN}{d}/{c.RESET}")
-    for idx, f in enumerate(sorted(files), 1):
-        filepath = os.path.join(WORK_PATH, f)
-        size = os.path.getsize(filepath)
+    lines.extend(f"       📂 {c.CYAN}{d}/{c.RESET}" for d in subdirs)
+    for idx, (f, size) in enumerate(files, 1):
         size_mb = size / (1024 * 1024)
         if f.lower().endswith(VIDEO_EXTENSIONS):
-            print(f"  {c.GREEN}[{idx:2d}]{c.RESET} 🎬 {c.WHITE}{f}{c.RESET} {c.DIM}({size_mb:.1f} MB){c.RESET}")
+            lines.append(LIST_VIDEO_ROW.format(idx=idx, name=f, size_mb=size_mb))
         else:
-            print(f"       🎵 {c.WHITE}{f}{c.RESET} {c.DIM}({size_mb:.1f} MB){c.RESET}")
-    print(f"{c.DIM}{'─' * 60}{c.RESET}")
+            lines.append(LIST_OTHER_ROW.format(name=f, size_mb=size_mb))
+    lines.append(divider)
+    print_lines(lines)
 
 
 def write_ffmpeg_concat_file(filepaths):
@@ -425,30 +626,78 @@ def write_ffmpeg_concat_file(filepaths):
     return temp_file.name
 
 
+def probe_stream_layout(filepath: str):
+    """Return the stream parameters that must match for a lossless concat."""
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_streams", "-of", "json", filepath],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    layout = []
+    for stream in json.loads(result.stdout).get("streams", []):
+        if stream.get("codec_type") == "video":
+            layout.append((
+                "video",
+                stream.get("codec_name"),
+                stream.get("width"),
+                stream.get("height"),
+                stream.get("r_frame_rate"),
+                stream.get("pix_fmt"),
+            ))
+        elif stream.get("codec_type") == "audio":
+            layout.append((
+                "audio",
+                stream.get("codec_name"),
+                stream.get("sample_rate"),
+                stream.get("channels"),
+            ))
+    return tuple(layout)
+
+
+def can_stream_copy(filepaths) -> bool:
+    """Return True when every input shares codecs, resolution and frame rate."""
+    try:
+        layouts = {probe_stream_layout(filepath) for filepath in filepaths}
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        return False
+    return len(layouts) == 1 and bool(layouts.pop())
+
+
+def parse_selection(selection: str, count: int):
+    """Parse space/comma separated menu numbers; return (indices, out_of_range).
+
+    Raises ValueError when an entry is not a number.
+    """
+    indices = [int(x) for x in selection.replace(',', ' ').split()]
+    invalid = [idx for idx in indices if not 1 <= idx <= count]
+    return indices, invalid
+
+
 def stitch_videos(output_name: str = None):
     """Interactive video stitching."""
     c = Colors
-    video_files = get_video_files()
+    video_entries = get_video_entries()
+    video_files = [name for name, _ in video_entries]
     
     if not video_files:
         print(f"{c.RED}❌ No video files found in {WORK_PATH}{c.RESET}")
         return False
     
     # Display available videos
-    print(f"\n{c.MAGENTA}{c.BOLD}🎬 Available videos for stitching:{c.RESET} {c.DIM}({WORK_PATH}){c.RESET}")
-    print(f"{c.DIM}{'─' * 60}{c.RESET}")
-    for idx, f in enumerate(video_files, 1):
-        filepath = os.path.join(WORK_PATH, f)
-        size_mb = os.path.getsize(filepath) / (1024 * 1024)
-        print(f"  {c.GREEN}[{idx:2d}]{c.RESET} {c.WHITE}{f}{c.RESET} {c.DIM}({size_mb:.1f} MB){c.RESET}")
-    print(f"{c.DIM}{'─' * 60}{c.RESET}")
+    divider = f"{c.DIM}{'─' * 60}{c.RESET}"
+    lines = [f"\n{c.MAGENTA}{c.BOLD}🎬 Available videos for stitching:{c.RESET} {c.DIM}({WORK_PATH}){c.RESET}", divider]
+    for idx, (f, size) in enumerate(video_entries, 1):
+        lines.append(MENU_VIDEO_ROW.format(idx=idx, name=f, size_mb=size / 1048576))
+    lines.append(divider)
+    print_lines(lines)
     
     # Get user selection
     print(f"\n{c.CYAN}Enter video numbers to stitch (in order), separated by spaces or commas.{c.RESET}")
     print(f"{c.DIM}Example: 1 3 2  or  1,3,2{c.RESET}")
     
     try:
-        selection = input("\nSelect videos: ").strip()
+        selection = prompt_input("\nSelect videos: ").strip()
     except (KeyboardInterrupt, EOFError):
         print("\nCancelled.")
         return False
@@ -457,21 +706,17 @@ def stitch_videos(output_name: str = None):
         print("No videos selected.")
         return False
     
-    # Parse selection
-    selection = selection.replace(',', ' ')
+    # Parse and validate selection
     try:
-        indices = [int(x.strip()) for x in selection.split() if x.strip()]
+        indices, invalid = parse_selection(selection, len(video_files))
     except ValueError:
         print(f"{c.RED}❌ Invalid input. Please enter numbers only.{c.RESET}")
         return False
     
-    # Validate indices
-    selected_files = []
-    for idx in indices:
-        if idx < 1 or idx > len(video_files):
-            print(f"{c.RED}❌ Invalid selection: {idx}. Valid range is 1-{len(video_files)}{c.RESET}")
-            return False
-        selected_files.append(video_files[idx - 1])
+    if invalid:
+        print(f"{c.RED}❌ Invalid selection: {', '.join(map(str, invalid))}. Valid range is 1-{len(video_files)}{c.RESET}")
+        return False
+    selected_files = [video_files[idx - 1] for idx in indices]
     
     if len(selected_files) < 2:
         print(f"{c.RED}❌ Please select at least 2 videos to stitch.{c.RESET}")
@@ -482,7 +727,7 @@ def stitch_videos(output_name: str = None):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         default_name = f"stitched_{timestamp}.mp4"
         try:
-            output_name = input(f"Output filename [{default_name}]: ").strip()
+            output_name = prompt_input(f"Output filename [{default_name}]: ").strip()
         except (KeyboardInterrupt, EOFError):
             print("\nCancelled.")
             return False
@@ -502,12 +747,12 @@ def stitch_videos(output_name: str = None):
     print(f"\n{c.CYAN}📁 Output:{c.RESET} {c.WHITE}{output_name}{c.RESET}")
     
     try:
-        confirm = input("\nProceed? [Y/n]: ").strip().lower()
+        confirm = prompt_input("\nProceed? [Y/n]: ").strip().lower()
     except (KeyboardInterrupt, EOFError):
         print("\nCancelled.")
         return False
     
-    if confirm and confirm not in ('y', 'yes'):
+    if confirm not in YES_ANSWERS:
         print("Cancelled.")
         return False
     
@@ -534,6 +779,8 @@ def stitch_videos(output_name: str = None):
             "0",
             "-i",
             concat_manifest,
+        ]
+        reencode_args = [
             "-c:v",
             "libx264",
             "-preset",
@@ -545,11 +792,25 @@ def stitch_videos(output_name: str = None):
             output_path,
         ]
 
-        print(f"\n{c.YELLOW}🔄 Stitching videos with ffmpeg (this may take a while)...{c.RESET}")
-        subprocess.run(
-            ffmpeg_command,
-            check=True,
-        )
+        # Matching inputs can be remuxed as-is; only mixed inputs need a re-encode.
+        stitched = False
+        if can_stream_copy(source_paths):
+            print(f"\n{c.YELLOW}🔄 Inputs match, joining without re-encoding...{c.RESET}")
+            try:
+                subprocess.run(
+                    ffmpeg_command + ["-c", "copy", "-movflags", "+faststart", output_path],
+                    check=True,
+                )
+                stitched = True
+            except subprocess.CalledProcessError:
+                print(f"{c.DIM}Stream copy failed, falling back to re-encoding.{c.RESET}")
+
+        if not stitched:
+            print(f"\n{c.YELLOW}🔄 Stitching videos with ffmpeg (this may take a while)...{c.RESET}")
+            subprocess.run(
+                ffmpeg_command + reencode_args,
+                check=True,
+            )
 
         output_size = os.path.getsize(output_path) / (1024 * 1024)
         print(f"\n{c.GREEN}✅ Successfully created:{c.RESET} {c.WHITE}{output_name}{c.RESET} {c.DIM}({output_size:.1f} MB){c.RESET}")
@@ -565,6 +826,7 @@ def stitch_videos(output_name: str = None):
     finally:
         if concat_manifest and os.path.exists(concat_manifest):
             os.remove(concat_manifest)
+        invalidate_dir_cache()
 
 
 def strip_audio_interactive():
@@ -572,7 +834,8 @@ def strip_audio_interactive():
     from moviepy import VideoFileClip
 
     c = Colors
-    video_files = get_video_files()
+    video_entries = get_video_entries()
+    video_files = [name for name, _ in video_entries]
 
     if not video_files:
         print(f"{c.RED}\u274c No video files found in {WORK_PATH}{c.RESET}")
@@ -581,14 +844,12 @@ def strip_audio_interactive():
     # Display available videos
     print(f"\n{c.MAGENTA}{c.BOLD}🔇 Strip Audio{c.RESET} {c.DIM}({WORK_PATH}){c.RESET}")
     print(f"{c.DIM}{'─' * 60}{c.RESET}")
-    for idx, f in enumerate(video_files, 1):
-        filepath = os.path.join(WORK_PATH, f)
-        size_mb = os.path.getsize(filepath) / (1024 * 1024)
-        print(f"  {c.GREEN}[{idx:2d}]{c.RESET} {c.WHITE}{f}{c.RESET} {c.DIM}({size_mb:.1f} MB){c.RESET}")
+    for idx, (f, size) in enumerate(video_entries, 1):
+        print(MENU_VIDEO_ROW.format(idx=idx, name=f, size_mb=size / 1048576))
     print(f"{c.DIM}{'─' * 60}{c.RESET}")
 
     try:
-        selection = input("\nSelect video to strip audio from (number): ").strip()
+        selection = prompt_input("\nSelect video to strip audio from (number): ").strip()
     except (KeyboardInterrupt, EOFError):
         print("\nCancelled.")
         return False
@@ -612,7 +873,7 @@ def strip_audio_interactive():
     default_output = f"{name}_noaudio{ext}"
 
     try:
-        output_name = input(f"{c.CYAN}Output filename{c.RESET} [{default_output}]: ").strip()
+        output_name = prompt_input(f"{c.CYAN}Output filename{c.RESET} [{default_output}]: ").strip()
     except (KeyboardInterrupt, EOFError):
         print("\nCancelled.")
         return False
@@ -629,12 +890,12 @@ def strip_audio_interactive():
     print(f"   {c.WHITE}Output:{c.RESET} {output_name}")
 
     try:
-        confirm = input("\nProceed? [Y/n]: ").strip().lower()
+        confirm = prompt_input("\nProceed? [Y/n]: ").strip().lower()
     except (KeyboardInterrupt, EOFError):
         print("\nCancelled.")
         return False
 
-    if confirm and confirm not in ('y', 'yes'):
+    if confirm not in YES_ANSWERS:
         print("Cancelled.")
         return False
 
@@ -656,35 +917,44 @@ def strip_audio_interactive():
     except Exception as e:
         print(f"\n{c.RED}❌ Error stripping audio:{c.RESET} {e}")
         return False
+    finally:
+        invalidate_dir_cache()
 
 
 def generate_qr_code(url: str, title: str) -> str:
     """Generate a QR code image for a URL and save to downloads folder."""
-    import qrcode
-    import re
-    
     try:
-        # Create QR code
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(url)
-        qr.make(fit=True)
-        
-        # Create image
-        img = qr.make_image(fill_color="black", back_color="white")
-        
         # Clean title for filename
-        safe_title = re.sub(r'[^\w\s-]', '', title).strip()[:50]
-        safe_title = re.sub(r'[-\s]+', '_', safe_title)
+        safe_title = UNSAFE_FILENAME_CHARS_RE.sub('', title).strip()[:50]
+        safe_title = FILENAME_SEPARATORS_RE.sub('_', safe_title)
         
         filename = f"{safe_title}_qr.png"
         filepath = os.path.join(WORK_PATH, filename)
         
-        img.save(filepath)
+        try:
+            import segno
+        except ImportError:
+            segno = None
+        
+        if segno is not None:
+            # Pure-Python PNG writer: no Pillow import or image buffer
+            segno.make_qr(url, error='l', boost_error=False).save(filepath, kind='png', scale=10, border=4)
+        else:
+            import qrcode
+            
+            qr = qrcode.QRCode(
+                version=1,
+                error_correction=qrcode.constants.ERROR_CORRECT_L,
+                box_size=10,
+                border=4,
+            )
+            qr.add_data(url)
+            qr.make(fit=True)
+            img = qr.make_image(fill_color="black", back_color="white")
+            # Fast zlib level: the image is tiny and not bandwidth-sensitive
+            img.save(filepath, format='PNG', optimize=False, compress_level=1)
+        
+        invalidate_dir_cache()
         return filename
         
     except Exception as e:
@@ -692,23 +962,115 @@ def generate_qr_code(url: str, title: str) -> str:
         return None
 
 
+def get_youtube_http():
+    """Return the httplib2 client whose connections are kept alive across YouTube API calls."""
+    global _YOUTUBE_HTTP
+    if _YOUTUBE_HTTP is None:
+        # build_http sets a socket timeout and stops treating the resumable
+        # protocol's 308 "Resume Incomplete" as a redirect
+        from googleapiclient.http import build_http
+        _YOUTUBE_HTTP = build_http()
+    return _YOUTUBE_HTTP
+
+
+def get_http_session():
+    """Return the pooled requests session used for all Google REST calls."""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        retries = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=RETRIABLE_STATUS_CODES,
+            raise_on_status=False,
+        )
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries))
+        _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+
+def save_credentials(token_file: str, credentials):
+    """Write OAuth credentials to disk as authorized-user JSON."""
+    os.makedirs(CREDENTIALS_PATH, exist_ok=True)
+    with open(token_file, 'w') as token:
+        token.write(credentials.to_json())
+
+
+def load_saved_credentials(token_file: str, legacy_token_file: str, scopes):
+    """Load saved OAuth credentials, migrating a legacy pickle token to JSON."""
+    from google.oauth2.credentials import Credentials
+
+    if not os.path.exists(token_file) and os.path.exists(legacy_token_file):
+        import pickle
+
+        try:
+            with open(legacy_token_file, 'rb') as token:
+                credentials = pickle.load(token)
+        except Exception:
+            credentials = None
+        if credentials:
+            save_credentials(token_file, credentials)
+        os.remove(legacy_token_file)
+        return credentials
+
+    if not os.path.exists(token_file):
+        return None
+    try:
+        return Credentials.from_authorized_user_file(token_file, scopes=scopes)
+    except ValueError:
+        # Missing refresh token or corrupt file; fall through to a fresh login
+        return None
+
+
+def clear_saved_credentials(token_file: str, legacy_token_file: str) -> bool:
+    """Delete saved OAuth credentials (JSON and legacy pickle); return True if any existed."""
+    removed = False
+    for path in (token_file, legacy_token_file):
+        if os.path.exists(path):
+            os.remove(path)
+            removed = True
+    return removed
+
+
+def clear_cached_credentials(youtube: bool = True, gcs: bool = True):
+    """Drop the in-memory clients so the next call re-reads saved tokens."""
+    global _YOUTUBE_SERVICE, _YOUTUBE_CREDENTIALS, _GCS_CREDENTIALS
+    if youtube:
+        _YOUTUBE_SERVICE = None
+        _YOUTUBE_CREDENTIALS = None
+    if gcs:
+        _GCS_CREDENTIALS = None
+
+
+def extract_oauth_code(redirect_url: str):
+    """Return the authorization code from a pasted OAuth redirect URL, or None."""
+    from urllib.parse import unquote
+
+    match = OAUTH_CODE_RE.search(redirect_url)
+    return unquote(match.group(1)) if match else None
+
+
 def get_gcs_credentials():
     """Get authenticated credentials for Google Cloud Storage."""
+    global _GCS_CREDENTIALS
     from google.oauth2.credentials import Credentials
     from google.auth.transport.requests import Request
     
-    credentials = None
+    if _GCS_CREDENTIALS is not None and _GCS_CREDENTIALS.valid:
+        return _GCS_CREDENTIALS
     
     # Check if we have saved credentials
-    if os.path.exists(GCS_TOKEN_FILE):
-        with open(GCS_TOKEN_FILE, 'rb') as token:
-            credentials = pickle.load(token)
+    credentials = load_saved_credentials(GCS_TOKEN_FILE, LEGACY_GCS_TOKEN_FILE, [GCS_SCOPE])
     
     # If no valid credentials, get new ones
     if not credentials or not credentials.valid:
         if credentials and credentials.expired and credentials.refresh_token:
             try:
-                credentials.refresh(Request())
+                credentials.refresh(Request(session=get_http_session()))
             except Exception:
                 credentials = None
         
@@ -718,8 +1080,7 @@ def get_gcs_credentials():
                 return None
             
             # Manual OAuth flow
-            import json
-            from urllib.parse import urlencode, urlparse, parse_qs
+            from urllib.parse import urlencode
             
             with open(CLIENT_SECRETS_FILE, 'r') as f:
                 client_config = json.load(f)
@@ -750,20 +1111,13 @@ def get_gcs_credentials():
             print("3. Copy the ENTIRE URL from your browser after redirect")
             print("=" * 60)
             
-            redirect_url = input("\nPaste the redirect URL here: ").strip()
+            redirect_url = prompt_input("\nPaste the redirect URL here: ").strip()
             
-            try:
-                parsed = urlparse(redirect_url)
-                code = parse_qs(parsed.query).get('code', [None])[0]
-                
-                if not code:
-                    print("❌ Could not find authorization code in URL")
-                    return None
-            except Exception as e:
-                print(f"❌ Error parsing URL: {e}")
+            code = extract_oauth_code(redirect_url)
+            if not code:
+                print("❌ Could not find authorization code in URL")
                 return None
             
-            import requests
             token_url = 'https://oauth2.googleapis.com/token'
             token_data = {
                 'client_id': client_id,
@@ -774,7 +1128,7 @@ def get_gcs_credentials():
             }
             
             try:
-                response = requests.post(token_url, data=token_data)
+                response = get_http_session().post(token_url, data=token_data)
                 token_json = response.json()
                 
                 if 'error' in token_json:
@@ -794,11 +1148,10 @@ def get_gcs_credentials():
                 return None
         
         # Save credentials
-        os.makedirs(CREDENTIALS_PATH, exist_ok=True)
-        with open(GCS_TOKEN_FILE, 'wb') as token:
-            pickle.dump(credentials, token)
+        save_credentials(GCS_TOKEN_FILE, credentials)
         print("✅ GCS authentication saved for future sessions.")
     
+    _GCS_CREDENTIALS = credentials
     return credentials
 
 
@@ -815,7 +1168,7 @@ def get_or_set_bucket_name():
     print("Enter your GCS bucket name.")
     print("(Create one at: https://console.cloud.google.com/storage/browser)")
     
-    bucket_name = input("\nBucket name: ").strip()
+    bucket_name = prompt_input("\nBucket name: ").strip()
     
     if bucket_name:
         os.makedirs(CREDENTIALS_PATH, exist_ok=True)
@@ -826,15 +1179,69 @@ def get_or_set_bucket_name():
     return bucket_name
 
 
-def backup_to_gcs(filepath: str, bucket_name: str, credentials) -> bool:
-    """Upload a file to Google Cloud Storage using REST API with resumable upload."""
-    import requests
+def clamp_gcs_chunk_size(chunk_size: int) -> int:
+    """Clamp a chunk size to the allowed range and align it to 256 KiB."""
+    chunk_size = max(GCS_MIN_CHUNK_SIZE, min(GCS_MAX_CHUNK_SIZE, chunk_size))
+    return chunk_size - chunk_size % RESUMABLE_CHUNK_ALIGNMENT
+
+
+def read_gcs_chunk_sizes() -> dict:
+    """Return the saved per-host chunk sizes, or an empty dict."""
+    try:
+        with open(GCS_CHUNK_SIZE_FILE, 'r') as f:
+            sizes = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return sizes if isinstance(sizes, dict) else {}
+
+
+def load_gcs_chunk_size(host: str) -> int:
+    """Return the chunk size a previous upload to host converged on."""
+    try:
+        chunk_size = int(read_gcs_chunk_sizes().get(host, GCS_DEFAULT_CHUNK_SIZE))
+    except (TypeError, ValueError):
+        chunk_size = GCS_DEFAULT_CHUNK_SIZE
+    return clamp_gcs_chunk_size(chunk_size)
+
+
+def save_gcs_chunk_size(host: str, chunk_size: int):
+    """Remember the converged chunk size for host so the next upload starts there."""
+    with _CHUNK_SIZE_LOCK:
+        sizes = read_gcs_chunk_sizes()
+        sizes[host] = chunk_size
+        try:
+            os.makedirs(CREDENTIALS_PATH, exist_ok=True)
+            with open(GCS_CHUNK_SIZE_FILE, 'w') as f:
+                json.dump(sizes, f)
+        except OSError:
+            pass
+
+
+def next_gcs_chunk_size(chunk_size: int, throughput: float, average: float) -> int:
+    """Double the chunk size when throughput beats its average by 20%, halve it when 20% worse."""
+    if throughput > average * 1.2:
+        chunk_size *= 2
+    elif throughput < average * 0.8:
+        chunk_size //= 2
+    return clamp_gcs_chunk_size(chunk_size)
+
+
+def backup_to_gcs(filepath: str, bucket_name: str, credentials, show_progress: bool = True) -> bool:
+    """Upload a file to Google Cloud Storage using REST API with resumable upload.
+
+    Safe to call from several threads with the same credentials; pass
+    show_progress=False there so per-chunk progress lines don't interleave.
+    """
     from google.auth.transport.requests import Request
+    from urllib.parse import urlsplit
+    
+    session = get_http_session()
     
     try:
         # Refresh credentials if needed
-        if credentials.expired:
-            credentials.refresh(Request())
+        with _CREDENTIALS_LOCK:
+            if credentials.expired:
+                credentials.refresh(Request(session=session))
         
         filename = os.path.basename(filepath)
         file_size = os.path.getsize(filepath)
@@ -844,16 +1251,9 @@ def backup_to_gcs(filepath: str, bucket_name: str, credentials) -> bool:
         
         # Determine content type
         ext = os.path.splitext(filename)[1].lower()
-        content_types = {
-            '.mp4': 'video/mp4',
-            '.mkv': 'video/x-matroska',
-            '.webm': 'video/webm',
-            '.avi': 'video/x-msvideo',
-            '.mov': 'video/quicktime',
-            '.mp3': 'audio/mpeg',
-            '.png': 'image/png',
-        }
-        content_type = content_types.get(ext, 'application/octet-stream')
+        content_type = (CONTENT_TYPES.get(ext)
+                        or mimetypes.guess_type(filename)[0]
+                        or 'application/octet-stream')
         
         # For files under 5MB, use simple upload
         if file_size < 5 * 1024 * 1024:
@@ -864,8 +1264,12 @@ def backup_to_gcs(filepath: str, bucket_name: str, credentials) -> bool:
                 'Content-Type': content_type
             }
             
+            # Small enough to read in one go: one read() and a sized body
+            # instead of requests streaming the file in 8 KB reads
             with open(filepath, 'rb') as f:
-                response = requests.post(upload_url, headers=headers, data=f)
+                payload = f.read()
+            headers['Content-Length'] = str(len(payload))
+            response = session.post(upload_url, headers=headers, data=payload)
         else:
             # Use resumable upload for larger files
             # Step 1: Initiate resumable upload
@@ -878,7 +1282,7 @@ def backup_to_gcs(filepath: str, bucket_name: str, credentials) -> bool:
                 'X-Upload-Content-Length': str(file_size)
             }
             
-            init_response = requests.post(init_url, headers=headers, json={'name': f'ytd-backups/{filename}'})
+            init_response = session.post(init_url, headers=headers, json={'name': f'ytd-backups/{filename}'})
             
             if init_response.status_code != 200:
                 error_msg = init_response.json().get('error', {}).get('message', init_response.text)
@@ -887,34 +1291,55 @@ def backup_to_gcs(filepath: str, bucket_name: str, credentials) -> bool:
             
             upload_url = init_response.headers['Location']
             
-            # Step 2: Upload file in chunks
-            chunk_size = 10 * 1024 * 1024  # 10MB chunks
+            # Step 2: Upload file in chunks, resizing them toward the best
+            # observed throughput and starting from the last converged size
+            upload_host = urlsplit(upload_url).netloc
+            chunk_size = load_gcs_chunk_size(upload_host)
+            average_throughput = None
             
-            with open(filepath, 'rb') as f:
+            # Slice chunks straight out of a read-only mapping so each PUT
+            # sends from the page cache instead of a freshly copied buffer.
+            with open(filepath, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                    memoryview(mm) as view:
                 uploaded = 0
                 while uploaded < file_size:
-                    chunk = f.read(chunk_size)
-                    chunk_end = uploaded + len(chunk) - 1
-                    
-                    headers = {
-                        'Content-Length': str(len(chunk)),
-                        'Content-Range': f'bytes {uploaded}-{chunk_end}/{file_size}'
-                    }
-                    
-                    response = requests.put(upload_url, headers=headers, data=chunk)
-                    
-                    uploaded += len(chunk)
-                    percent = int((uploaded / file_size) * 100)
-                    print(f"\r   Uploading {filename}: {percent}%", end='', flush=True)
+                    with view[uploaded:min(uploaded + chunk_size, file_size)] as chunk:
+                        chunk_end = uploaded + len(chunk) - 1
+                        
+                        headers = {
+                            'Content-Length': str(len(chunk)),
+                            'Content-Range': f'bytes {uploaded}-{chunk_end}/{file_size}'
+                        }
+                        
+                        started = time.monotonic()
+                        response = session.put(upload_url, headers=headers, data=chunk)
+                        elapsed = time.monotonic() - started
+                        
+                        uploaded += len(chunk)
+                        # Only full chunks are representative; the final one is usually short
+                        if len(chunk) == chunk_size and elapsed > 0:
+                            throughput = len(chunk) / elapsed
+                            if average_throughput is None:
+                                average_throughput = throughput
+                            else:
+                                chunk_size = next_gcs_chunk_size(chunk_size, throughput, average_throughput)
+                                average_throughput += GCS_THROUGHPUT_SMOOTHING * (throughput - average_throughput)
+                    if show_progress:
+                        percent = int((uploaded / file_size) * 100)
+                        print(f"\r   Uploading {filename}: {percent}%", end='', flush=True)
                     
                     # Check for completion or error
                     if response.status_code not in (200, 201, 308):
-                        print()
+                        if show_progress:
+                            print()
                         error_msg = response.json().get('error', {}).get('message', response.text) if response.text else 'Unknown error'
                         print(f"   ❌ Failed: {error_msg}")
                         return False
             
-            print()  # New line after progress
+            if show_progress:
+                print()  # New line after progress
+            save_gcs_chunk_size(upload_host, chunk_size)
         
         if response.status_code in (200, 201):
             print(f"   ✅ Uploaded: gs://{bucket_name}/ytd-backups/{filename}")
@@ -932,7 +1357,8 @@ def backup_to_gcs(filepath: str, bucket_name: str, credentials) -> bool:
 def backup_interactive():
     """Interactive backup to Google Cloud Storage."""
     c = Colors
-    video_files = get_video_files()
+    video_entries = get_video_entries()
+    video_files = [name for name, _ in video_entries]
     
     if not video_files:
         print(f"{c.RED}❌ No video files found in {WORK_PATH}{c.RESET}")
@@ -950,20 +1376,19 @@ def backup_interactive():
         return False
     
     # Display available videos
-    print(f"\n{c.BLUE}{c.BOLD}☁️  Cloud Backup{c.RESET} {c.DIM}({WORK_PATH}){c.RESET}")
-    print(f"{c.DIM}{'─' * 60}{c.RESET}")
-    for idx, f in enumerate(video_files, 1):
-        filepath = os.path.join(WORK_PATH, f)
-        size_mb = os.path.getsize(filepath) / (1024 * 1024)
-        print(f"  {c.GREEN}[{idx:2d}]{c.RESET} {c.WHITE}{f}{c.RESET} {c.DIM}({size_mb:.1f} MB){c.RESET}")
-    print(f"{c.DIM}{'─' * 60}{c.RESET}")
+    divider = f"{c.DIM}{'─' * 60}{c.RESET}"
+    lines = [f"\n{c.BLUE}{c.BOLD}☁️  Cloud Backup{c.RESET} {c.DIM}({WORK_PATH}){c.RESET}", divider]
+    for idx, (f, size) in enumerate(video_entries, 1):
+        lines.append(MENU_VIDEO_ROW.format(idx=idx, name=f, size_mb=size / 1048576))
+    lines.append(divider)
+    print_lines(lines)
     
     # Get user selection
     print(f"\n{c.CYAN}Enter video numbers to backup, separated by spaces or commas.")
     print(f"Or type '{c.GREEN}all{c.CYAN}' to backup everything.{c.RESET}")
     
     try:
-        selection = input(f"\n{c.CYAN}Select videos:{c.RESET} ").strip()
+        selection = prompt_input(f"\n{c.CYAN}Select videos:{c.RESET} ").strip()
     except (KeyboardInterrupt, EOFError):
         print("\nCancelled.")
         return False
@@ -976,78 +1401,101 @@ def backup_interactive():
     if selection.lower() == 'all':
         selected_files = video_files
     else:
-        selection = selection.replace(',', ' ')
         try:
-            indices = [int(x.strip()) for x in selection.split() if x.strip()]
+            indices, invalid = parse_selection(selection, len(video_files))
         except ValueError:
             print(f"{c.RED}❌ Invalid input. Please enter numbers only.{c.RESET}")
             return False
         
-        selected_files = []
-        for idx in indices:
-            if idx < 1 or idx > len(video_files):
-                print(f"{c.RED}❌ Invalid selection: {idx}. Valid range is 1-{len(video_files)}{c.RESET}")
-                return False
-            selected_files.append(video_files[idx - 1])
+        if invalid:
+            print(f"{c.RED}❌ Invalid selection: {', '.join(map(str, invalid))}. Valid range is 1-{len(video_files)}{c.RESET}")
+            return False
+        selected_files = [video_files[idx - 1] for idx in indices]
+    
+    if not selected_files:
+        print(f"{c.YELLOW}No videos selected.{c.RESET}")
+        return False
     
     # Confirm
     print(f"\n{c.CYAN}{c.BOLD}📋 Backup to:{c.RESET} {c.WHITE}gs://{bucket_name}/ytd-backups/{c.RESET}")
     print(f"   {c.WHITE}Files:{c.RESET} {len(selected_files)} video(s)")
     
     try:
-        confirm = input(f"\n{c.CYAN}Proceed with backup?{c.RESET} [Y/n]: ").strip().lower()
+        confirm = prompt_input(f"\n{c.CYAN}Proceed with backup?{c.RESET} [Y/n]: ").strip().lower()
     except (KeyboardInterrupt, EOFError):
         print("\nCancelled.")
         return False
     
-    if confirm and confirm not in ('y', 'yes'):
+    if confirm not in YES_ANSWERS:
         print("Cancelled.")
         return False
     
     # Perform backup
     print(f"\n{c.YELLOW}📤 Starting backup...{c.RESET}")
     success_count = 0
+    max_workers = min(BACKUP_MAX_WORKERS, len(selected_files))
+    show_progress = max_workers == 1
     
-    for filename in selected_files:
-        filepath = os.path.join(WORK_PATH, filename)
-        if backup_to_gcs(filepath, bucket_name, credentials):
-            success_count += 1
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = [
+            executor.submit(backup_to_gcs, os.path.join(WORK_PATH, filename),
+                            bucket_name, credentials, show_progress)
+            for filename in selected_files
+        ]
+        for future in as_completed(futures):
+            if future.result():
+                success_count += 1
+    except KeyboardInterrupt:
+        # Drop the queued files instead of waiting for every upload to finish
+        executor.shutdown(wait=False, cancel_futures=True)
+        print(f"\n{c.YELLOW}Backup cancelled:{c.RESET} {c.WHITE}{success_count}/{len(selected_files)}{c.RESET} files uploaded")
+        return False
+    finally:
+        # Every future has finished by here unless the loop was interrupted
+        executor.shutdown(wait=False)
     
     print(f"\n{c.GREEN}✅ Backup complete:{c.RESET} {c.WHITE}{success_count}/{len(selected_files)}{c.RESET} files uploaded")
     return success_count == len(selected_files)
 
 
-def get_authenticated_service():
-    """Get authenticated YouTube API service."""
+def get_authenticated_service(interactive: bool = True):
+    """Get authenticated YouTube API service.
+
+    With interactive=False, returns None instead of starting the OAuth
+    prompt, so it can run in the background.
+    """
+    global _YOUTUBE_SERVICE, _YOUTUBE_CREDENTIALS
     from google_auth_oauthlib.flow import InstalledAppFlow
     from google.auth.transport.requests import Request
     from googleapiclient.discovery import build
+    from google_auth_httplib2 import AuthorizedHttp
     
-    credentials = None
+    if _YOUTUBE_SERVICE is not None and _YOUTUBE_CREDENTIALS.valid:
+        return _YOUTUBE_SERVICE
     
     # Check if we have saved credentials
-    if os.path.exists(OAUTH_TOKEN_FILE):
-        with open(OAUTH_TOKEN_FILE, 'rb') as token:
-            credentials = pickle.load(token)
+    credentials = load_saved_credentials(OAUTH_TOKEN_FILE, LEGACY_OAUTH_TOKEN_FILE, [YOUTUBE_UPLOAD_SCOPE])
     
     # If no valid credentials, get new ones
     if not credentials or not credentials.valid:
         if credentials and credentials.expired and credentials.refresh_token:
             try:
-                credentials.refresh(Request())
+                credentials.refresh(Request(session=get_http_session()))
             except Exception:
                 credentials = None
         
         if not credentials:
+            if not interactive:
+                return None
             if not os.path.exists(CLIENT_SECRETS_FILE):
                 print("❌ client_secrets.json not found!")
                 print("   Please follow the setup instructions in README.md")
                 return None
             
             # Manual OAuth flow for container compatibility
-            import json
             from google.oauth2.credentials import Credentials
-            from urllib.parse import urlencode, urlparse, parse_qs
+            from urllib.parse import urlencode
             
             with open(CLIENT_SECRETS_FILE, 'r') as f:
                 client_config = json.load(f)
@@ -1082,22 +1530,15 @@ def get_authenticated_service():
             print("   (It will look like: http://localhost:8080/?code=...)")
             print("=" * 60)
             
-            redirect_url = input("\nPaste the redirect URL here: ").strip()
+            redirect_url = prompt_input("\nPaste the redirect URL here: ").strip()
             
             # Parse the code from the URL
-            try:
-                parsed = urlparse(redirect_url)
-                code = parse_qs(parsed.query).get('code', [None])[0]
-                
-                if not code:
-                    print("❌ Could not find authorization code in URL")
-                    return None
-            except Exception as e:
-                print(f"❌ Error parsing URL: {e}")
+            code = extract_oauth_code(redirect_url)
+            if not code:
+                print("❌ Could not find authorization code in URL")
                 return None
             
             # Exchange code for tokens
-            import requests
             token_url = 'https://oauth2.googleapis.com/token'
             token_data = {
                 'client_id': client_id,
@@ -1108,7 +1549,7 @@ def get_authenticated_service():
             }
             
             try:
-                response = requests.post(token_url, data=token_data)
+                response = get_http_session().post(token_url, data=token_data)
                 token_json = response.json()
                 
                 if 'error' in token_json:
@@ -1128,18 +1569,165 @@ def get_authenticated_service():
                 return None
         
         # Save credentials for future use
-        os.makedirs(CREDENTIALS_PATH, exist_ok=True)
-        with open(OAUTH_TOKEN_FILE, 'wb') as token:
-            pickle.dump(credentials, token)
-        print("✅ Authentication saved for future sessions.")
-    
-    return build(YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION, credentials=credentials)
+        save_credentials(OAUTH_TOKEN_FILE, credentials)
+        if interactive:
+            print("✅ Authentication saved for future sessions.")
+    
+    # The bundled discovery document avoids fetching it over HTTP, and the shared
+    # httplib2 client keeps its TLS connection open between uploads
+    authed_http = AuthorizedHttp(credentials, http=get_youtube_http())
+    _YOUTUBE_SERVICE = build(YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION,
+                             http=authed_http, cache_discovery=False, static_discovery=True)
+    _YOUTUBE_CREDENTIALS = credentials
+    return _YOUTUBE_SERVICE
+
+
+def pick_upload_chunk_size(file_size: int) -> int:
+    """Choose the YouTube upload chunk size for a file.
+
+    Bigger chunks mean fewer requests but more data to resend after a
+    network hiccup, so the default aims for about 50 chunks per file.
+    YTD_UPLOAD_CHUNK_MB forces a size; either way the result stays
+    within 5-100 MiB.
+    """
+    override = os.environ.get("YTD_UPLOAD_CHUNK_MB", "").strip()
+    if override:
+        try:
+            chunk_mb = int(override)
+        except ValueError:
+            chunk_mb = 0
+        if chunk_mb > 0:
+            return max(YOUTUBE_MIN_CHUNK_SIZE, min(YOUTUBE_MAX_CHUNK_SIZE, chunk_mb * 1024 * 1024))
+
+    chunk_size = max(YOUTUBE_MIN_CHUNK_SIZE, min(YOUTUBE_MAX_CHUNK_SIZE, file_size // YOUTUBE_CHUNKS_PER_FILE))
+    return chunk_size - chunk_size % RESUMABLE_CHUNK_ALIGNMENT
+
+
+def warm_file_cache(filepath: str):
+    """Ask the kernel to start reading a file's first upload chunk into the page cache."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        length = pick_upload_chunk_size(os.fstat(fd).st_size)
+        os.posix_fadvise(fd, 0, length, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(fd)
+
+
+def open_for_streaming(filepath: str) -> int:
+    """Open a file for one sequential read pass, skipping atime updates where allowed."""
+    noatime = getattr(os, 'O_NOATIME', 0)
+    try:
+        fd = os.open(filepath, os.O_RDONLY | noatime)
+    except PermissionError:
+        # O_NOATIME is refused (EPERM) on files the process doesn't own
+        fd = os.open(filepath, os.O_RDONLY)
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return fd
+
+
+@functools.lru_cache(maxsize=1)
+def get_pread_upload_class():
+    """Return the read-ahead MediaUpload subclass, importing googleapiclient on first use."""
+    from googleapiclient.http import MediaUpload
+
+    class PreadFileUpload(MediaUpload):
+        """Resumable file upload that reads the next chunk while the current one is sent.
+
+        YouTube's resumable protocol only accepts chunks in order, so the
+        network side stays sequential; overlapping the disk read with the
+        PUT hides read latency (slow or network-mounted drives) instead.
+        Chunks are read into two preallocated buffers that take turns, so
+        no per-chunk bytes objects are allocated.
+        """
+
+        def __init__(self, filepath: str, mimetype: str, chunksize: int):
+            self._fd = open_for_streaming(filepath)
+            try:
+                self._size = os.fstat(self._fd).st_size
+                self._mimetype = mimetype
+                self._chunksize = chunksize
+                # Never larger than the file; a file that fits in one chunk needs no second buffer
+                buffer_size = min(chunksize, self._size)
+                count = 2 if self._size > chunksize else 1
+                self._buffers = [bytearray(buffer_size) for _ in range(count)]
+                self._reader = ThreadPoolExecutor(max_workers=1)
+                self._prefetch = None  # (offset, length, buffer index, future)
+            except BaseException:
+                os.close(self._fd)
+                raise
+
+        def chunksize(self):
+            return self._chunksize
+
+        def mimetype(self):
+            return self._mimetype
+
+        def size(self):
+            return self._size
+
+        def resumable(self):
+            return True
+
+        def _read(self, index, length, begin):
+            # A short chunk would be taken as end of file, so keep reading until the
+            # chunk is full or EOF (a single preadv can come up short on network mounts)
+            view = memoryview(self._buffers[index])[:length]
+            filled = 0
+            while filled < length:
+                count = os.preadv(self._fd, [view[filled:]], begin + filled)
+                if count == 0:
+                    break
+                filled += count
+            return view[:filled]
+
+        def getbytes(self, begin, length):
+            if length > self._chunksize:
+                return os.pread(self._fd, length, begin)
+
+            data = None
+            index = 0
+            if self._prefetch is not None:
+                offset, prefetched_length, index, future = self._prefetch
+                self._prefetch = None
+                # Always wait, so the buffer is no longer being written
+                prefetched = future.result()
+                if (offset, prefetched_length) == (begin, length):
+                    data = prefetched
+            if data is None:
+                # First chunk, or the server asked to resume from another offset
+                data = self._read(index, length, begin)
+
+            # The other buffer is free: the chunk it held has already been sent
+            next_begin = begin + len(data)
+            if next_begin < self._size and len(self._buffers) > 1:
+                future = self._reader.submit(self._read, 1 - index, length, next_begin)
+                self._prefetch = (next_begin, length, 1 - index, future)
+            return data
+
+        def close(self):
+            self._reader.shutdown(wait=True)
+            os.close(self._fd)
+
+    return PreadFileUpload
+
+
+def report_qr_code(future):
+    """Print the QR code filename once background generation finishes.
+
+    Runs on a pool thread; prompt_input's patch_stdout keeps this line
+    from garbling a prompt that is already on screen.
+    """
+    qr_filename = future.result()
+    if qr_filename:
+        print(f"   QR Code: {qr_filename}")
 
 
 def upload_video_to_youtube(filepath: str, title: str, description: str = "", 
                             privacy: str = "private", tags: list = None):
     """Upload a video to YouTube."""
-    from googleapiclient.http import MediaFileUpload
     from googleapiclient.errors import HttpError
     
     youtube = get_authenticated_service()
@@ -1162,14 +1750,11 @@ def upload_video_to_youtube(filepath: str, title: str, description: str = "",
     }
     
     # Create media upload object
-    media = MediaFileUpload(
-        filepath,
-        mimetype='video/mp4',
-        resumable=True,
-        chunksize=1024*1024  # 1MB chunks
-    )
-    
+    media = None
     try:
+        chunk_size = pick_upload_chunk_size(os.path.getsize(filepath))
+        media = get_pread_upload_class()(filepath, 'video/mp4', chunk_size)
+        
         insert_request = youtube.videos().insert(
             part=','.join(body.keys()),
             body=body,
@@ -1186,10 +1771,9 @@ def upload_video_to_youtube(filepath: str, title: str, description: str = "",
             print(f"   Video ID: {video_id}")
             print(f"   URL: {video_url}")
             
-            # Generate QR code
-            qr_filename = generate_qr_code(video_url, title)
-            if qr_filename:
-                print(f"   QR Code: {qr_filename}")
+            # Generate QR code in the background so the next command isn't blocked
+            qr_future = _POST_POOL.submit(generate_qr_code, video_url, title)
+            qr_future.add_done_callback(report_qr_code)
             
             if privacy == 'private':
                 print(f"\n📢 To share with domain users:")
@@ -1199,34 +1783,68 @@ def upload_video_to_youtube(filepath: str, title: str, description: str = "",
             return True
         return False
         
-    except HttpError as e:
+    except (HttpError, OSError, MemoryError) as e:
         print(f"\n❌ Upload failed: {e}")
         return False
+    finally:
+        if media is not None:
+            media.close()
+
+
+def next_backoff(prev: float, base: float = 1.0, cap: float = 60.0, rng=random) -> float:
+    """Decorrelated-jitter backoff: a random sleep between base and 3x the previous one."""
+    return min(cap, rng.uniform(base, max(base, prev * 3)))
+
+
+def retry_after_seconds(e) -> float:
+    """Return the server's Retry-After delay in seconds, or 0 if absent or not numeric."""
+    try:
+        return max(0.0, float(e.resp.get('retry-after', 0)))
+    except (TypeError, ValueError):
+        return 0.0
 
 
 def resumable_upload(insert_request):
     """Execute resumable upload with retry logic."""
+    import http.client
+    import httplib2
     from googleapiclient.errors import HttpError
     
+    # Transport errors worth retrying; built once rather than on every chunk
+    retriable_exceptions = (httplib2.HttpLib2Error, IOError, http.client.NotConnected,
+                            http.client.IncompleteRead, http.client.ImproperConnectionState,
+                            http.client.CannotSendRequest, http.client.CannotSendHeader,
+                            http.client.ResponseNotReady, http.client.BadStatusLine)
+    
     response = None
     error = None
     retry = 0
+    prev_sleep = 1.0
+    server_delay = 0.0
+    # Per-upload generator, seeded from the OS, so concurrent uploads don't share RNG state
+    rng = random.Random(os.urandom(8))
+    last_percent = -1
+    last_time = 0.0
     
     while response is None:
         try:
             status, response = insert_request.next_chunk()
             if status:
                 percent = int(status.progress() * 100)
-                print(f"\r   Uploaded: {percent}%", end='', flush=True)
+                now = time.monotonic()
+                # Redraw only when the percentage moves, at most every PROGRESS_INTERVAL
+                if percent != last_percent and now - last_time >= PROGRESS_INTERVAL:
+                    sys.stdout.write(f"\r   Uploaded: {percent}%")
+                    sys.stdout.flush()
+                    last_percent = percent
+                    last_time = now
         except HttpError as e:
             if e.resp.status in RETRIABLE_STATUS_CODES:
                 error = f"Retriable HTTP error {e.resp.status}: {e.content}"
+                server_delay = retry_after_seconds(e)
             else:
                 raise
-        except (httplib2.HttpLib2Error, IOError, http.client.NotConnected,
-                http.client.IncompleteRead, http.client.ImproperConnectionState,
-                http.client.CannotSendRequest, http.client.CannotSendHeader,
-                http.client.ResponseNotReady, http.client.BadStatusLine) as e:
+        except retriable_exceptions as e:
             error = f"Retriable error: {e}"
         
         if error:
@@ -1235,10 +1853,14 @@ def resumable_upload(insert_request):
                 print(f"\n❌ Max retries exceeded. Last error: {error}")
                 return None
             
-            sleep_seconds = random.random() * (2 ** retry)
+            if server_delay:
+                sleep_seconds = server_delay
+            else:
+                sleep_seconds = prev_sleep = next_backoff(prev_sleep, rng=rng)
             print(f"\n   Retry {retry}/{MAX_RETRIES} in {sleep_seconds:.1f}s...")
             time.sleep(sleep_seconds)
             error = None
+            server_delay = 0.0
     
     return response
 
@@ -1246,7 +1868,9 @@ def resumable_upload(insert_request):
 def upload_interactive():
     """Interactive video upload wizard."""
     c = Colors
-    video_files = get_video_files()
+    # Sizes in MB are computed once, for the menu and the confirm screen
+    rows = [(name, size / 1048576) for name, size in get_video_entries()]
+    video_files = [name for name, _ in rows]
     
     if not video_files:
         print(f"{c.RED}❌ No video files found in {WORK_PATH}{c.RESET}")
@@ -1266,15 +1890,13 @@ def upload_interactive():
     # Display available videos
     print(f"\n{c.RED}{c.BOLD}📤 YouTube Upload Wizard{c.RESET} {c.DIM}({WORK_PATH}){c.RESET}")
     print(f"{c.DIM}{'─' * 60}{c.RESET}")
-    for idx, f in enumerate(video_files, 1):
-        filepath = os.path.join(WORK_PATH, f)
-        size_mb = os.path.getsize(filepath) / (1024 * 1024)
-        print(f"  {c.GREEN}[{idx:2d}]{c.RESET} {c.WHITE}{f}{c.RESET} {c.DIM}({size_mb:.1f} MB){c.RESET}")
+    for idx, (f, size_mb) in enumerate(rows, 1):
+        print(MENU_VIDEO_ROW.format(idx=idx, name=f, size_mb=size_mb))
     print(f"{c.DIM}{'─' * 60}{c.RESET}")
     
     # Get user selection
     try:
-        selection = input("\nSelect video to upload (number): ").strip()
+        selection = prompt_input("\nSelect video to upload (number): ").strip()
     except (KeyboardInterrupt, EOFError):
         print("\nCancelled.")
         return False
@@ -1292,9 +1914,13 @@ def upload_interactive():
         print(f"{c.RED}❌ Please enter a number.{c.RESET}")
         return False
     
-    selected_file = video_files[idx - 1]
+    selected_file, selected_size_mb = rows[idx - 1]
     filepath = os.path.join(WORK_PATH, selected_file)
     
+    # Refresh the token, build the client and warm the first chunk while the user types
+    service_future = _POST_POOL.submit(get_authenticated_service, False)
+    _POST_POOL.submit(warm_file_cache, filepath)
+    
     # Get video details
     default_title = os.path.splitext(selected_file)[0]
     sources = []
@@ -1303,11 +1929,11 @@ def upload_interactive():
         print(f"\n{c.CYAN}Selected:{c.RESET} {c.WHITE}{selected_file}{c.RESET}")
         print(f"{c.DIM}{'─' * 40}{c.RESET}")
         
-        title = input(f"{c.CYAN}Title{c.RESET} [{default_title}]: ").strip()
+        title = prompt_input(f"{c.CYAN}Title{c.RESET} [{default_title}]: ").strip()
         if not title:
             title = default_title
         
-        description = input(f"{c.CYAN}Description{c.RESET} (optional): ").strip()
+        description = prompt_input(f"{c.CYAN}Description{c.RESET} (optional): ").strip()
         
         # Original sources for attribution
         print(f"\n{c.YELLOW}📎 Original Sources (for attribution):{c.RESET}")
@@ -1316,27 +1942,26 @@ def upload_interactive():
         
         sources = []
         while True:
-            source = input("  Source: ").strip()
+            source = prompt_input("  Source: ").strip()
             if not source:
                 break
             sources.append(source)
         
         # Build full description with attribution
         if sources:
-            attribution = "\n\n---\nOriginal content used with permission from:\n"
-            for src in sources:
-                attribution += f"• {src}\n"
-            attribution += "\nAll rights belong to the original creators."
+            attribution = ("\n\n---\nOriginal content used with permission from:\n"
+                           + "".join(f"• {src}\n" for src in sources)
+                           + "\nAll rights belong to the original creators.")
             description = description + attribution if description else attribution.strip()
         
-        tags_input = input(f"{c.CYAN}Tags{c.RESET} (comma-separated, optional): ").strip()
+        tags_input = prompt_input(f"{c.CYAN}Tags{c.RESET} (comma-separated, optional): ").strip()
         tags = [t.strip() for t in tags_input.split(',') if t.strip()] if tags_input else []
         
         print(f"\n{c.MAGENTA}🔒 Privacy options:{c.RESET}")
         print(f"  {c.GREEN}private{c.RESET}  - Only you can view")
         print(f"  {c.YELLOW}unlisted{c.RESET} - Anyone with the link can view")
         print(f"  {c.RED}public{c.RESET}   - Anyone can find and view")
-        privacy = input(f"{c.CYAN}Privacy{c.RESET} [private]: ").strip().lower()
+        privacy = prompt_input(f"{c.CYAN}Privacy{c.RESET} [private]: ").strip().lower()
         if privacy not in ('public', 'unlisted', 'private'):
             privacy = 'private'
         
@@ -1346,7 +1971,7 @@ def upload_interactive():
     
     # Confirm
     print(f"\n{c.CYAN}{c.BOLD}📋 Upload Details:{c.RESET}")
-    print(f"   {c.WHITE}File:{c.RESET} {selected_file}")
+    print(f"   {c.WHITE}File:{c.RESET} {selected_file} {c.DIM}({selected_size_mb:.1f} MB){c.RESET}")
     print(f"   {c.WHITE}Title:{c.RESET} {title}")
     if sources:
         # Show original description without attribution for clarity
@@ -1359,15 +1984,21 @@ def upload_interactive():
     print(f"   {c.WHITE}Privacy:{c.RESET} {privacy}")
     
     try:
-        confirm = input("\nProceed with upload? [Y/n]: ").strip().lower()
+        confirm = prompt_input("\nProceed with upload? [Y/n]: ").strip().lower()
     except (KeyboardInterrupt, EOFError):
         print("\nCancelled.")
         return False
     
-    if confirm and confirm not in ('y', 'yes'):
+    if confirm not in YES_ANSWERS:
         print("Cancelled.")
         return False
     
+    # Let the background auth finish first; if it needs the OAuth prompt,
+    # upload_video_to_youtube runs it in the foreground
+    try:
+        service_future.result()
+    except Exception:
+        pass
     return upload_video_to_youtube(filepath, title, description, privacy, tags)
 
 
@@ -1378,13 +2009,13 @@ def qr_interactive():
         print(f"\n{c.YELLOW}{c.BOLD}📱 QR Code Generator{c.RESET}")
         print(f"{c.DIM}{'─' * 40}{c.RESET}")
         
-        url = input(f"{c.CYAN}Enter URL:{c.RESET} ").strip()
+        url = prompt_input(f"{c.CYAN}Enter URL:{c.RESET} ").strip()
         if not url:
             print(f"{c.YELLOW}No URL provided.{c.RESET}")
             return False
         
         default_name = "qr_code"
-        name = input(f"{c.CYAN}QR code name{c.RESET} [{default_name}]: ").strip()
+        name = prompt_input(f"{c.CYAN}QR code name{c.RESET} [{default_name}]: ").strip()
         if not name:
             name = default_name
         
@@ -1400,10 +2031,10 @@ def qr_interactive():
         return False
 
 
-def print_help():
-    """Print help message with colors and icons."""
+def build_help_text() -> str:
+    """Render the help message with colors and icons."""
     c = Colors
-    print(f"""
+    return f"""
 {c.RED}╔{'═' * 48}╗{c.RESET}
 {c.RED}║{c.RESET}  {c.BOLD}{c.WHITE}📺  YouTube Downloader CLI{c.RESET}                    {c.RED}║{c.RESET}
 {c.RED}╚{'═' * 48}╝{c.RESET}
@@ -1442,7 +2073,132 @@ def print_help():
   {c.CYAN}audio{c.RESET} https://youtu.be/dQw4w9WgXcQ
     {c.CYAN}project external /Volumes/MyDrive/Videos/my-compilation{c.RESET}
   {c.CYAN}project{c.RESET} my-compilation → {c.CYAN}stitch{c.RESET} → {c.CYAN}upload{c.RESET} → {c.CYAN}qr{c.RESET}
-""")
+"""
+
+
+def build_banner() -> str:
+    """Render the welcome banner shown when interactive mode starts."""
+    c = Colors
+    return f"""
+{c.RED}╔{'═' * 48}╗{c.RESET}
+{c.RED}║{c.RESET}                                                {c.RED}║{c.RESET}
+{c.RED}║{c.RESET}   {c.BOLD}{c.WHITE}📺  YouTube Downloader CLI  📺{c.RESET}               {c.RED}║{c.RESET}
+{c.RED}║{c.RESET}                                                {c.RED}║{c.RESET}
+{c.RED}║{c.RESET}   {c.DIM}Type '{c.GREEN}help{c.DIM}' for available commands{c.RESET}        {c.RED}║{c.RESET}
+{c.RED}║{c.RESET}                                                {c.RED}║{c.RESET}
+{c.RED}╚{'═' * 48}╝{c.RESET}
+"""
+
+
+# Colors are settled at import (TTY / NO_COLOR), so both screens are rendered once
+HELP_TEXT = build_help_text()
+BANNER = build_banner()
+
+
+def print_help():
+    """Print help message with colors and icons."""
+    print(HELP_TEXT)
+
+
+# Returned by a command handler to end the interactive loop
+EXIT_CLI = object()
+
+
+def exit_command(args: str):
+    """Say goodbye and end the interactive loop."""
+    c = Colors
+    print(f"\n{c.YELLOW}👋 Goodbye!{c.RESET}\n")
+    return EXIT_CLI
+
+
+def project_command(args: str):
+    """List project folders, or switch to the one named in args."""
+    c = Colors
+    if not args:
+        list_projects()
+    elif args.lower().startswith('external '):
+        set_external_project(args[9:].strip())
+    elif args.lower() == 'external':
+        if EXTERNAL_PROJECT_SOURCE:
+            set_external_project(EXTERNAL_PROJECT_SOURCE)
+        else:
+            print(f"{c.YELLOW}Usage:{c.RESET} project external /path/to/folder")
+    elif args.lower() in ('root', 'downloads'):
+        set_project(None)
+    else:
+        set_project(args)
+
+
+def auth_command(args: str):
+    """Force re-authentication with YouTube and/or GCS."""
+    c = Colors
+    print(f"\n{c.CYAN}{c.BOLD}🔑 Re-authenticate{c.RESET}")
+    print(f"  {c.GREEN}1.{c.RESET} YouTube")
+    print(f"  {c.GREEN}2.{c.RESET} Google Cloud Storage")
+    print(f"  {c.GREEN}3.{c.RESET} Both")
+    choice = prompt_input(f"\n{c.CYAN}Choice{c.RESET} [3]: ").strip() or "3"
+    
+    if choice in ('1', '3'):
+        clear_cached_credentials(youtube=True, gcs=False)
+        if clear_saved_credentials(OAUTH_TOKEN_FILE, LEGACY_OAUTH_TOKEN_FILE):
+            print(f"{c.GREEN}✅ Cleared YouTube credentials.{c.RESET}")
+        get_authenticated_service()
+        
+    if choice in ('2', '3'):
+        clear_cached_credentials(youtube=False, gcs=True)
+        if clear_saved_credentials(GCS_TOKEN_FILE, LEGACY_GCS_TOKEN_FILE):
+            print(f"{c.GREEN}✅ Cleared GCS credentials.{c.RESET}")
+        if choice == '2':
+            get_gcs_credentials()
+
+
+def qr_command(args: str):
+    """Generate a QR code for the URL in args, or run the QR wizard."""
+    c = Colors
+    if args:
+        # If URL provided directly, prompt for name only
+        name = prompt_input(f"{c.CYAN}QR code name{c.RESET} [qr_code]: ").strip() or "qr_code"
+        filename = generate_qr_code(args, name)
+        if filename:
+            print(f"{c.GREEN}✅ QR code saved:{c.RESET} {c.WHITE}{filename}{c.RESET}")
+    else:
+        qr_interactive()
+
+
+def url_command(name: str, action):
+    """Wrap a URL-taking action so a missing URL prints its usage line."""
+    def handler(args: str):
+        if not args:
+            c = Colors
+            print(f"{c.YELLOW}Usage:{c.RESET} {name} <URL>")
+        else:
+            action(args)
+    return handler
+
+
+# Interactive commands and their aliases, each called with the rest of the input line
+COMMANDS = {
+    'exit': exit_command,
+    'quit': exit_command,
+    'q': exit_command,
+    'help': lambda args: print_help(),
+    'list': lambda args: list_downloads(),
+    'project': project_command,
+    'proj': project_command,
+    'folder': project_command,
+    'stitch': lambda args: stitch_videos(args if args else None),
+    'strip-audio': lambda args: strip_audio_interactive(),
+    'strip': lambda args: strip_audio_interactive(),
+    'noaudio': lambda args: strip_audio_interactive(),
+    'mute': lambda args: strip_audio_interactive(),
+    'upload': lambda args: upload_interactive(),
+    'auth': auth_command,
+    'qr': qr_command,
+    'backup': lambda args: backup_interactive(),
+    'video': url_command('video', download_video),
+    'audio': url_command('audio', download_audio_only),
+    'info': url_command('info', get_video_info),
+}
 
 
 def interactive_mode():
@@ -1454,15 +2210,7 @@ def interactive_mode():
     if project_env:
         set_project(project_env)
 
-    print(f"""
-{c.RED}╔{'═' * 48}╗{c.RESET}
-{c.RED}║{c.RESET}                                                {c.RED}║{c.RESET}
-{c.RED}║{c.RESET}   {c.BOLD}{c.WHITE}📺  YouTube Downloader CLI  📺{c.RESET}               {c.RED}║{c.RESET}
-{c.RED}║{c.RESET}                                                {c.RED}║{c.RESET}
-{c.RED}║{c.RESET}   {c.DIM}Type '{c.GREEN}help{c.DIM}' for available commands{c.RESET}        {c.RED}║{c.RESET}
-{c.RED}║{c.RESET}                                                {c.RED}║{c.RESET}
-{c.RED}╚{'═' * 48}╝{c.RESET}
-""")
+    print(BANNER)
 
     if EXTERNAL_PROJECT_SOURCE:
         print(f"{c.BLUE}Mounted host project:{c.RESET} {c.WHITE}{EXTERNAL_PROJECT_SOURCE}{c.RESET}")
@@ -1470,16 +2218,21 @@ def interactive_mode():
     elif HOST_ROOT_MAPPINGS:
         print(f"{c.DIM}Use 'project external /path/to/folder' to open a host folder.{c.RESET}")
     
+    # Prompt pieces that don't depend on the current folder
+    prompt_head = f"{c.RED}ytd{c.RESET}"
+    prompt_tail = f"{c.BOLD}{c.WHITE}>{c.RESET} "
+    folder_color, reset = c.CYAN, c.RESET
+    
     while True:
         # Build prompt showing current project folder
         if WORK_PATH == OUTPUT_PATH:
             folder_label = ""
         else:
-            folder_label = f" {c.CYAN}{get_folder_label()}{c.RESET}"
-        prompt = f"{c.RED}ytd{c.RESET}{folder_label}{c.BOLD}{c.WHITE}>{c.RESET} "
+            folder_label = f" {folder_color}{get_folder_label()}{reset}"
+        prompt = f"{prompt_head}{folder_label}{prompt_tail}"
 
         try:
-            user_input = input(prompt).strip()
+            user_input = prompt_input(prompt).strip()
             
             if not user_input:
                 continue
@@ -1488,79 +2241,10 @@ def interactive_mode():
             command = parts[0].lower()
             args = parts[1] if len(parts) > 1 else ""
             
-            if command in ('exit', 'quit', 'q'):
-                print(f"\n{c.YELLOW}👋 Goodbye!{c.RESET}\n")
-                break
-            elif command == 'help':
-                print_help()
-            elif command == 'list':
-                list_downloads()
-            elif command in ('project', 'proj', 'folder'):
-                if not args:
-                    list_projects()
-                elif args.lower().startswith('external '):
-                    set_external_project(args[9:].strip())
-                elif args.lower() == 'external':
-                    if EXTERNAL_PROJECT_SOURCE:
-                        set_external_project(EXTERNAL_PROJECT_SOURCE)
-                    else:
-                        print(f"{c.YELLOW}Usage:{c.RESET} project external /path/to/folder")
-                elif args.lower() in ('root', 'downloads'):
-                    set_project(None)
-                else:
-                    set_project(args)
-            elif command == 'stitch':
-                stitch_videos(args if args else None)
-            elif command in ('strip-audio', 'strip', 'noaudio', 'mute'):
-                strip_audio_interactive()
-            elif command == 'upload':
-                upload_interactive()
-            elif command == 'auth':
-                # Force re-authentication
-                print(f"\n{c.CYAN}{c.BOLD}🔑 Re-authenticate{c.RESET}")
-                print(f"  {c.GREEN}1.{c.RESET} YouTube")
-                print(f"  {c.GREEN}2.{c.RESET} Google Cloud Storage")
-                print(f"  {c.GREEN}3.{c.RESET} Both")
-                choice = input(f"\n{c.CYAN}Choice{c.RESET} [3]: ").strip() or "3"
-                
-                if choice in ('1', '3'):
-                    if os.path.exists(OAUTH_TOKEN_FILE):
-                        os.remove(OAUTH_TOKEN_FILE)
-                        print(f"{c.GREEN}✅ Cleared YouTube credentials.{c.RESET}")
-                    get_authenticated_service()
-                    
-                if choice in ('2', '3'):
-                    if os.path.exists(GCS_TOKEN_FILE):
-                        os.remove(GCS_TOKEN_FILE)
-                        print(f"{c.GREEN}✅ Cleared GCS credentials.{c.RESET}")
-                    if choice == '2':
-                        get_gcs_credentials()
-            elif command == 'qr':
-                if args:
-                    # If URL provided directly, prompt for name only
-                    name = input(f"{c.CYAN}QR code name{c.RESET} [qr_code]: ").strip() or "qr_code"
-                    filename = generate_qr_code(args, name)
-                    if filename:
-                        print(f"{c.GREEN}✅ QR code saved:{c.RESET} {c.WHITE}{filename}{c.RESET}")
-                else:
-                    qr_interactive()
-            elif command == 'backup':
-                backup_interactive()
-            elif command == 'video':
-                if not args:
-                    print(f"{c.YELLOW}Usage:{c.RESET} video <URL>")
-                else:
-                    download_video(args)
-            elif command == 'audio':
-                if not args:
-                    print(f"{c.YELLOW}Usage:{c.RESET} audio <URL>")
-                else:
-                    download_audio_only(args)
-            elif command == 'info':
-                if not args:
-                    print(f"{c.YELLOW}Usage:{c.RESET} info <URL>")
-                else:
-                    get_video_info(args)
+            handler = COMMANDS.get(command)
+            if handler:
+                if handler(args) is EXIT_CLI:
+                    break
             else:
                 # Assume it's a URL if it looks like one
                 if user_input.startswith(('http://', 'https://', 'www.')):